@@ -1,9 +1,19 @@
 # analyzer.py
+from operator import itemgetter
+
+# Marks a memoized value that has not been computed yet (None is a valid cutoff)
+_NOT_COMPUTED = object()
+
 class PlayoffsAnalyzer:
     def __init__(self, simulation_results, standings, teams):
         self.results = simulation_results
         self.standings = standings
         self.teams = teams
+        self._by_team = {t["team"]: t for t in self.standings}
+        
+        # Cutoffs do not depend on the team, so they are computed once
+        self._current_cutoff = _NOT_COMPUTED
+        self._expected_cutoff = _NOT_COMPUTED
     
     def get_qualification_probabilities(self):
         """Get qualification probabilities sorted by probability"""
@@ -54,10 +64,17 @@ class PlayoffsAnalyzer:
     
     def find_current_playoff_cutoff(self):
         """Find the current playoff cutoff (points of 4th place team)"""
+        if self._current_cutoff is _NOT_COMPUTED:
+            self._current_cutoff = self._compute_current_playoff_cutoff()
+        
+        return self._current_cutoff
+    
+    def _compute_current_playoff_cutoff(self):
+        """Compute the points of the current 4th place team"""
         # Sort standings by points, then NRR
         sorted_standings = sorted(
             self.standings,
-            key=lambda x: (x["points"], x["nrr"]),
+            key=itemgetter("points", "nrr"),
             reverse=True
         )
         
@@ -68,10 +85,17 @@ class PlayoffsAnalyzer:
     
     def calculate_expected_cutoff(self):
         """Calculate expected playoff cutoff based on simulations"""
+        if self._expected_cutoff is _NOT_COMPUTED:
+            self._expected_cutoff = self._compute_expected_cutoff()
+        
+        return self._expected_cutoff
+    
+    def _compute_expected_cutoff(self):
+        """Compute the expected playoff cutoff from simulated position probabilities"""
         # Get current 4th place points
         sorted_standings = sorted(
             self.standings,
-            key=lambda x: (x["points"], x["nrr"]),
+            key=itemgetter("points", "nrr"),
             reverse=True
         )
         current_cutoff = sorted_standings[3]["points"] if len(sorted_standings) >= 4 else 0
@@ -95,7 +119,7 @@ class PlayoffsAnalyzer:
         weighted_points = 0
         for team, prob in fourth_place_probs.items():
             # Get current points
-            team_standing = next((t for t in self.standings if t["team"] == team), None)
+            team_standing = self._by_team.get(team)
             if team_standing:
                 # Weight by probability of finishing 4th
                 current_points = team_standing["points"]
@@ -111,7 +135,7 @@ class PlayoffsAnalyzer:
     def generate_qualification_scenarios(self, team_id):
         """Generate qualification scenarios for a specific team"""
         # Get team standing
-        team_standing = next((t for t in self.standings if t["team"] == team_id), None)
+        team_standing = self._by_team.get(team_id)
         if not team_standing:
             return None
         
@@ -1,6 +1,8 @@
 # data_loader.py
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 class DataLoader:
     def __init__(self, data_dir="data"):
@@ -11,18 +13,32 @@ class DataLoader:
         self.home_away_stats = None
         self.form_factor = None
         self.historical_thresholds = None
+        self._json_cache = {}
     
     def load_all_data(self):
         """Load all data files"""
-        self.teams = self._load_json_file("teams.json")
-        self.standings = self._load_json_file("current_standings.json")
-        self.schedule = self._load_json_file("schedule.json")
-        self.home_away_stats = self._load_json_file("home_away_stats.json")
-        self.form_factor = self._load_json_file("form_factor.json")
+        filenames = [
+            "teams.json",
+            "current_standings.json",
+            "schedule.json",
+            "home_away_stats.json",
+            "form_factor.json",
+            "historical_thresholds.json"
+        ]
+        
+        # Read all files concurrently
+        with ThreadPoolExecutor(max_workers=len(filenames)) as executor:
+            futures = {filename: executor.submit(self._load_json_file, filename) for filename in filenames}
         
-        # Try to load historical thresholds if available
+        self.teams = futures["teams.json"].result()
+        self.standings = futures["current_standings.json"].result()
+        self.schedule = futures["schedule.json"].result()
+        self.home_away_stats = futures["home_away_stats.json"].result()
+        self.form_factor = futures["form_factor.json"].result()
+        
+        # Historical thresholds are optional
         try:
-            self.historical_thresholds = self._load_json_file("historical_thresholds.json")
+            self.historical_thresholds = futures["historical_thresholds.json"].result()
         except FileNotFoundError:
             self.historical_thresholds = None
         
@@ -36,10 +52,13 @@ class DataLoader:
         }
     
     def _load_json_file(self, filename):
-        """Load a JSON file from the data directory"""
-        file_path = os.path.join(self.data_dir, filename)
-        with open(file_path, 'r') as file:
-            return json.load(file)
+        """Load a JSON file from the data directory (cached after the first read)"""
+        if filename not in self._json_cache:
+            file_path = os.path.join(self.data_dir, filename)
+            with open(file_path, 'rb') as file:
+                self._json_cache[filename] = orjson.loads(file.read())
+        
+        return self._json_cache[filename]
     
     def get_team_by_id(self, team_id):
         """Get team information by ID"""
@@ -1,10 +1,26 @@
 # elo_calculator.py
+import math
+
+import numpy as np
+
 class EloCalculator:
+    # 10 ** (x / 400) == exp(_ELO_K * x)
+    _ELO_K = math.log(10) / 400
+    
     def __init__(self, standings, form_factor, home_away_stats):
         self.standings = standings
         self.form_factor = form_factor
         self.home_away_stats = home_away_stats
         self.ratings = self._initialize_elo_ratings()
+        
+        # Home advantage per team, scaled by how much better the team performs at home (minimum 30 points)
+        self._home_adv = {
+            team["teamId"]: max(30, (team["homeWinRate"] - 0.5) * 100)
+            for team in self.home_away_stats
+        }
+        
+        # Win probabilities keyed by (home_team, away_team), valid until ratings change
+        self._wp_cache = {}
     
     def _initialize_elo_ratings(self):
         """Initialize ELO ratings based on current standings and other factors"""
@@ -20,6 +36,9 @@ class EloCalculator:
         for team_id in team_ids:
             ratings[team_id] = 1500
         
+        # Recent form bonus of every team, computed in one pass over the form data
+        form_bonuses = self._calculate_form_bonuses()
+        
         # Adjust based on current season performance
         for team in self.standings:
             team_id = team["team"]
@@ -31,8 +50,7 @@ class EloCalculator:
             ratings[team_id] += team["nrr"] * 50
             
             # Form factor adjustment
-            form_bonus = self._calculate_form_bonus(team_id)
-            ratings[team_id] += form_bonus
+            ratings[team_id] += form_bonuses.get(team_id, 0)
             
             # Win percentage adjustment
             if team["played"] > 0:
@@ -42,35 +60,21 @@ class EloCalculator:
         
         return ratings
     
-    def _calculate_form_bonus(self, team_id):
-        """Calculate bonus based on recent form"""
-        form = None
-        
-        # Find team in form factor data
-        for team in self.form_factor:
-            if team["teamId"] == team_id:
-                form = team["recentForm"]
-                break
-        
-        if not form:
-            return 0
-        
-        # Calculate bonus based on recent results
+    def _calculate_form_bonuses(self):
+        """Calculate bonus based on recent form for every team"""
         # More recent matches have higher weight
-        form_bonus = 0
         weights = [1, 0.8, 0.6, 0.4, 0.2]  # Most recent match has highest weight
         
-        for i, result in enumerate(form):
-            if i >= len(weights):
-                break
-            
-            if result == "W":
-                form_bonus += 10 * weights[i]
-            elif result == "L":
-                form_bonus -= 5 * weights[i]
+        form_bonuses = {}
+        for team in self.form_factor:
+            # Calculate bonus based on recent results
             # No change for "N" (no result)
+            form_bonuses[team["teamId"]] = sum(
+                weight * (10 if result == "W" else -5 if result == "L" else 0)
+                for result, weight in zip(team["recentForm"], weights)
+            )
         
-        return form_bonus
+        return form_bonuses
     
     def get_ratings(self):
         """Get all team ELO ratings"""
@@ -82,26 +86,31 @@ class EloCalculator:
     
     def calculate_win_probability(self, home_team, away_team):
         """Calculate win probability based on ELO ratings"""
+        key = (home_team, away_team)
+        if key in self._wp_cache:
+            return self._wp_cache[key]
+        
         home_rating = self.get_team_rating(home_team)
         away_rating = self.get_team_rating(away_team)
         
-        # Apply home advantage
-        home_advantage = 0
-        
-        # Find home team's home win rate
-        for team in self.home_away_stats:
-            if team["teamId"] == home_team:
-                # Scale home advantage by how much better the team performs at home
-                home_advantage = (team["homeWinRate"] - 0.5) * 100
-                break
-        
         # Add home advantage (minimum 30 points)
-        adjusted_home_rating = home_rating + max(30, home_advantage)
+        adjusted_home_rating = home_rating + self._home_adv.get(home_team, 30)
         
         # Calculate probability using ELO formula
-        exp_home = 1 / (1 + 10 ** ((away_rating - adjusted_home_rating) / 400))
+        exp_home = 1.0 / (1.0 + math.exp(self._ELO_K * (away_rating - adjusted_home_rating)))
+        self._wp_cache[key] = exp_home
         return exp_home
     
+    def calculate_win_probabilities(self, matches):
+        """Calculate home win probabilities for a list of matches based on ELO ratings"""
+        adjusted_home_ratings = np.array([
+            self.get_team_rating(match["homeTeam"]) + self._home_adv.get(match["homeTeam"], 30)
+            for match in matches
+        ])
+        away_ratings = np.array([self.get_team_rating(match["awayTeam"]) for match in matches])
+        
+        return 1.0 / (1.0 + np.exp(self._ELO_K * (away_ratings - adjusted_home_ratings)))
+    
     def update_ratings(self, home_team, away_team, home_team_won, k_factor=32):
         """Update ELO ratings after a match"""
         # Get current ratings
@@ -124,6 +133,9 @@ class EloCalculator:
         self.ratings[home_team] = new_home_rating
         self.ratings[away_team] = new_away_rating
         
+        # Cached win probabilities are stale once ratings change
+        self._wp_cache.clear()
+        
         return {
             home_team: new_home_rating,
             away_team: new_away_rating
@@ -3,7 +3,7 @@ from data_loader import DataLoader
 from elo_calculator import EloCalculator
 from simulator import MonteCarloSimulator
 from analyzer import PlayoffsAnalyzer
-import json
+import orjson
 import time
 
 def run_playoffs_prediction(iterations=10000):
@@ -14,6 +14,7 @@ def run_playoffs_prediction(iterations=10000):
     print("Loading data...")
     data_loader = DataLoader()
     data = data_loader.load_all_data()
+    name_by_id = {t["id"]: t["name"] for t in data["teams"]}
     
     # 2. Calculate ELO ratings
     print("Calculating ELO ratings...")
@@ -28,7 +29,7 @@ def run_playoffs_prediction(iterations=10000):
     print("\nTeam ELO Ratings:")
     sorted_ratings = sorted(ratings.items(), key=lambda x: x[1], reverse=True)
     for team, rating in sorted_ratings:
-        team_name = next((t["name"] for t in data["teams"] if t["id"] == team), team)
+        team_name = name_by_id.get(team, team)
         print(f"{team_name}: {rating:.1f}")
     
     # 3. Run Monte Carlo simulation
@@ -56,7 +57,7 @@ def run_playoffs_prediction(iterations=10000):
     print("\nPlayoff Qualification Probabilities:")
     qual_probs = playoff_report["qualification_probabilities"]
     for team, prob in qual_probs:
-        team_name = next((t["name"] for t in data["teams"] if t["id"] == team), team)
+        team_name = name_by_id.get(team, team)
         status = analyzer.get_team_qualification_status(team)
         print(f"{team_name}: {prob*100:.1f}% ({status})")
     
@@ -67,20 +68,21 @@ def run_playoffs_prediction(iterations=10000):
     # 8. Display scenarios for each team
     print("\nTeam Qualification Scenarios:")
     for team_id, scenario in playoff_report["team_scenarios"].items():
-        team_name = next((t["name"] for t in data["teams"] if t["id"] == team_id), team_id)
+        team_name = name_by_id.get(team_id, team_id)
         print(f"\n{team_name}:")
         print(f"  Current points: {scenario['current_points']}")
         print(f"  Points needed: {scenario['points_needed']} (approx. {scenario['wins_needed']} wins)")
         print(f"  Qualification probability: {scenario['qualification_probability']*100:.1f}%")
     
     # 9. Save results to file
-    with open("playoff_predictions.json", "w") as f:
-        json.dump({
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "qualification_probabilities": {team: prob for team, prob in qual_probs},
-            "expected_cutoff": expected_cutoff,
-            "team_scenarios": playoff_report["team_scenarios"]
-        }, f, indent=2)
+    predictions = {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "qualification_probabilities": dict(qual_probs),
+        "expected_cutoff": expected_cutoff,
+        "team_scenarios": playoff_report["team_scenarios"]
+    }
+    with open("playoff_predictions.json", "wb") as f:
+        f.write(orjson.dumps(predictions, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     # Print execution time
     execution_time = time.time() - start_time
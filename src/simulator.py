@@ -1,7 +1,67 @@
 # simulator.py
-import random
-import copy
-from collections import defaultdict
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, run_simulation falls back to NumPy
+    njit = None
+    prange = range
+
+
+def _run_sims_numba(home_idx, away_idx, p_home, base_points, base_nrr, uniforms, nrr_deltas, n_teams):
+    """Simulate one season per row of the pre-drawn random matrices and count the final positions of every team"""
+    n_iters, n_matches = uniforms.shape
+    order = np.empty((n_iters, n_teams), dtype=np.int32)
+    
+    for it in prange(n_iters):
+        # Each iteration works on its own standings, so threads never share state
+        points = base_points.copy()
+        nrr = base_nrr.copy()
+        
+        for j in range(n_matches):
+            if uniforms[it, j] < p_home[j]:
+                winner = home_idx[j]
+                loser = away_idx[j]
+            else:
+                winner = away_idx[j]
+                loser = home_idx[j]
+            
+            # Note: NRR updates are simplified
+            delta = nrr_deltas[it, j]
+            points[winner] += 2
+            nrr[winner] += delta
+            nrr[loser] -= delta
+        
+        # Rank teams by points, then NRR (insertion sort, there are only a handful of teams)
+        row = order[it]
+        for team in range(n_teams):
+            pos = team
+            while pos > 0 and (
+                points[row[pos - 1]] < points[team]
+                or (points[row[pos - 1]] == points[team] and nrr[row[pos - 1]] < nrr[team])
+            ):
+                row[pos] = row[pos - 1]
+                pos -= 1
+            row[pos] = team
+    
+    # Reduce serially so that threads never write to the same counter
+    position_counts = np.zeros((n_teams, n_teams), dtype=np.int32)
+    for it in range(n_iters):
+        for pos in range(n_teams):
+            position_counts[order[it, pos], pos] += 1
+    
+    return position_counts
+
+
+if njit is not None:
+    # Cache the compiled kernel on disk so later runs skip JIT compilation
+    _run_sims_numba = njit(parallel=True, fastmath=True, cache=True)(_run_sims_numba)
+
+
+def _standings_key(points, nrr):
+    """Encode points, then NRR, as a single int64 key that preserves the standings order"""
+    return points.astype(np.int64) * 10_000_000 + (nrr * 1_000_000).astype(np.int64)
+
 
 class MonteCarloSimulator:
     def __init__(self, standings, schedule, elo_calculator):
@@ -9,115 +69,92 @@ class MonteCarloSimulator:
         self.schedule = schedule
         self.elo_calculator = elo_calculator
         self.teams = self._extract_teams()
+        self._team_idx = {team_id: i for i, team_id in enumerate(self.teams)}
+        self._by_team = {t["team"]: t for t in self.standings}
+        
+        # Base standings as parallel arrays indexed by team (struct-of-arrays)
+        self._base_points = np.array([t["points"] for t in self.standings], dtype=np.int32)
+        self._base_nrr = np.array([t["nrr"] for t in self.standings], dtype=np.float32)
+        
+        # Matches between teams not in the standings yet (e.g. playoff
+        # fixtures still "To be announced") cannot change the standings
+        self._sim_schedule = [
+            match for match in self.schedule
+            if match["homeTeam"] in self._team_idx and match["awayTeam"] in self._team_idx
+        ]
+        
+        # Resolve home/away team of every match to team indices once
+        self._home_idx = np.array([self._team_idx[m["homeTeam"]] for m in self._sim_schedule], dtype=np.int32)
+        self._away_idx = np.array([self._team_idx[m["awayTeam"]] for m in self._sim_schedule], dtype=np.int32)
     
     def _extract_teams(self):
         """Extract list of teams from standings"""
         return [team["team"] for team in self.standings]
     
-    def _clone_standings(self):
-        """Create a deep copy of standings for simulation"""
-        return copy.deepcopy(self.standings)
-    
-    def _update_standings(self, standings, winner_id, loser_id):
-        """Update standings after a match"""
-        for team in standings:
-            if team["team"] == winner_id:
-                team["played"] += 1
-                team["wins"] += 1
-                team["points"] += 2
-                # Note: NRR updates are simplified
-                team["nrr"] = round(team["nrr"] + random.uniform(0.05, 0.15), 3)
-            elif team["team"] == loser_id:
-                team["played"] += 1
-                team["losses"] += 1
-                # Note: NRR updates are simplified
-                team["nrr"] = round(team["nrr"] - random.uniform(0.05, 0.15), 3)
-        
-        return standings
-    
-    def _get_playoff_teams(self, standings):
-        """Get the top 4 teams from standings"""
-        # Sort by points, then NRR
-        sorted_teams = sorted(
-            standings,
-            key=lambda x: (x["points"], x["nrr"]),
-            reverse=True
-        )
+    def _run_sims_numpy(self, p_home, uniforms, nrr_deltas):
+        """Simulate all iterations with NumPy and count the final positions of every team"""
+        n_teams = len(self.teams)
+        iterations = uniforms.shape[0]
         
-        # Return top 4 team IDs
-        return [team["team"] for team in sorted_teams[:4]]
-    
-    def simulate_match(self, match, use_elo=True):
-        """Simulate a single match"""
-        home_team = match["homeTeam"]
-        away_team = match["awayTeam"]
+        # Simulate every match of every iteration in one shot (rows are iterations)
+        home_wins = uniforms < p_home[None, :]
+        winners = np.where(home_wins, self._home_idx, self._away_idx)
+        losers = np.where(home_wins, self._away_idx, self._home_idx)
         
-        if use_elo:
-            # Use ELO ratings to determine win probability
-            home_win_prob = self.elo_calculator.calculate_win_probability(home_team, away_team)
-        else:
-            # Use simple 50/50 probability
-            home_win_prob = 0.5
+        # Accumulate final standings per iteration
+        rows = np.arange(iterations)[:, None]
+        points = np.tile(self._base_points, (iterations, 1))
+        nrr = np.tile(self._base_nrr.astype(np.float64), (iterations, 1))
+        np.add.at(points, (rows, winners), 2)
+        np.add.at(nrr, (rows, winners), nrr_deltas)
+        np.add.at(nrr, (rows, losers), -nrr_deltas)
         
-        # Simulate match outcome
-        if random.random() < home_win_prob:
-            return home_team  # Home team wins
-        else:
-            return away_team  # Away team wins
+        # Sort final standings by points, then NRR: order[i, pos] is the team at pos in iteration i
+        order = np.argsort(-_standings_key(points, nrr), axis=1, kind="stable")
+        
+        # Count positions for each team (0-indexed positions)
+        position_counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+        np.add.at(position_counts, (order, np.arange(n_teams)[None, :]), 1)
+        return position_counts
     
     def run_simulation(self, iterations=10000, use_elo=True):
         """Run Monte Carlo simulation"""
-        # Track qualification count for each team
-        qualification_count = {team: 0 for team in self.teams}
-        
-        # Track position counts for each team (0-indexed positions)
-        position_counts = {team: [0, 0, 0, 0, 0, 0, 0, 0, 0, 0] for team in self.teams}
+        n_teams = len(self.teams)
+        n_matches = len(self._sim_schedule)
         
         # Debug info
         total_matches = len(self.schedule)
         print(f"Total matches in schedule: {total_matches}")
         
-        for i in range(iterations):
-            # Clone current standings for this simulation
-            sim_standings = self._clone_standings()
-            
-            # Simulate all remaining matches
-            matches_simulated = 0
-            for match in self.schedule:
-                winner = self.simulate_match(match, use_elo)
-                loser = match["awayTeam"] if winner == match["homeTeam"] else match["homeTeam"]
-                
-                # Update standings
-                sim_standings = self._update_standings(sim_standings, winner, loser)
-                matches_simulated += 1
-            
-            # Sort final standings
-            sorted_standings = sorted(
-                sim_standings,
-                key=lambda x: (x["points"], x["nrr"]),
-                reverse=True
+        # Ratings are fixed for the whole run, so every match has a constant home win probability
+        if use_elo:
+            p_home = self.elo_calculator.calculate_win_probabilities(self._sim_schedule)
+        else:
+            # Use simple 50/50 probability
+            p_home = np.full(n_matches, 0.5)
+        
+        # Draw all random numbers from NumPy's global generator so that both paths
+        # are reproducible with np.random.seed (numba threads have their own streams)
+        uniforms = np.random.random((iterations, n_matches))
+        # Note: NRR updates are simplified
+        nrr_deltas = np.random.uniform(0.05, 0.15, (iterations, n_matches))
+        
+        if njit is not None:
+            position_counts = _run_sims_numba(
+                self._home_idx, self._away_idx, p_home,
+                self._base_points, self._base_nrr, uniforms, nrr_deltas, n_teams
             )
-            
-            # Record positions
-            for pos, team in enumerate(sorted_standings):
-                team_id = team["team"]
-                position_counts[team_id][pos] += 1
-                
-                # Record playoff qualification (top 4)
-                if pos < 4:
-                    qualification_count[team_id] += 1
-            
-            # Print progress occasionally
-            if i % 1000 == 0 and i > 0:
-                print(f"Completed {i} simulations, {matches_simulated} matches per sim")
+        else:
+            position_counts = self._run_sims_numpy(p_home, uniforms, nrr_deltas)
         
-        # Calculate qualification probabilities
-        qualification_probability = {}
-        position_probability = {}
+        # Playoff qualification is a top 4 finish
+        qualification_count = position_counts[:, :4].sum(axis=1)
+        
+        print(f"Completed {iterations} simulations, {n_matches} matches per sim")
         
-        for team in self.teams:
-            qualification_probability[team] = qualification_count[team] / iterations
-            position_probability[team] = [count / iterations for count in position_counts[team]]
+        # Calculate qualification probabilities
+        qualification_probability = dict(zip(self.teams, (qualification_count / iterations).tolist()))
+        position_probability = dict(zip(self.teams, (position_counts / iterations).tolist()))
         
         # Print stats about top teams
         sorted_qual = sorted(qualification_probability.items(), key=lambda x: x[1], reverse=True)
@@ -133,28 +170,34 @@ class MonteCarloSimulator:
     def calculate_path_to_playoffs(self, team_id, iterations=1000):
         """Calculate minimum wins needed for playoff qualification"""
         # Get current team standing
-        team_standing = next((t for t in self.standings if t["team"] == team_id), None)
+        team_standing = self._by_team.get(team_id)
         if not team_standing:
             print(f"Team with ID '{team_id}' not found in standings")
             # Return empty dict with structure instead of None
             return {0: {"potential_points": 0, "qualification_probability": 0}}
         
-        # Get remaining matches for this team
+        # Partition the schedule into this team's remaining matches and all other matches once
+        team_idx = self._team_idx[team_id]
         remaining_matches = [
-            match for match in self.schedule
-            if match["homeTeam"] == team_id or match["awayTeam"] == team_id
+            j for j in range(len(self._sim_schedule))
+            if self._home_idx[j] == team_idx or self._away_idx[j] == team_idx
         ]
+        remaining_set = set(remaining_matches)
+        other_matches = [j for j in range(len(self._sim_schedule)) if j not in remaining_set]
         remaining_count = len(remaining_matches)
         current_points = team_standing["points"]
         
+        # Simulate all win counts in one batch
+        qualification_probs = self._simulate_fixed_wins_batch(
+            team_idx, remaining_matches, other_matches, iterations
+        )
+        
         results = {}
         
         # Try each possible win count
         for wins in range(remaining_count + 1):
             potential_points = current_points + (wins * 2)
-            
-            # Run simulations with fixed win count
-            qualification_prob = self._simulate_with_fixed_wins(team_id, wins, remaining_matches, iterations)
+            qualification_prob = qualification_probs[wins]
             
             results[wins] = {
                 "potential_points": potential_points,
@@ -169,43 +212,68 @@ class MonteCarloSimulator:
         
         return results
     
-    def _simulate_with_fixed_wins(self, team_id, wins, remaining_matches, iterations=1000):
-        """Run simulations with a fixed number of wins for a team"""
-        qualification_count = 0
+    def _simulate_fixed_wins_batch(self, team_idx, remaining_matches, other_matches, iterations=1000):
+        """Run simulations for every fixed number of wins of a team at once"""
+        n_teams = len(self.teams)
+        remaining_count = len(remaining_matches)
         
-        for _ in range(iterations):
-            # Clone standings
-            sim_standings = self._clone_standings()
-            
-            # Simulate with fixed number of wins for the target team
-            remaining_matches_copy = remaining_matches.copy()
-            random.shuffle(remaining_matches_copy)
-            
-            # First wins matches: team wins
-            for i in range(wins):
-                if i < len(remaining_matches_copy):
-                    match = remaining_matches_copy[i]
-                    winner = team_id
-                    loser = match["awayTeam"] if winner == match["homeTeam"] else match["homeTeam"]
-                    sim_standings = self._update_standings(sim_standings, winner, loser)
-            
-            # Remaining matches: team loses
-            for i in range(wins, len(remaining_matches_copy)):
-                match = remaining_matches_copy[i]
-                loser = team_id
-                winner = match["awayTeam"] if loser == match["homeTeam"] else match["homeTeam"]
-                sim_standings = self._update_standings(sim_standings, winner, loser)
-            
-            # Simulate other matches
-            other_matches = [m for m in self.schedule if m not in remaining_matches]
-            for match in other_matches:
-                winner = self.simulate_match(match)
-                loser = match["awayTeam"] if winner == match["homeTeam"] else match["homeTeam"]
-                sim_standings = self._update_standings(sim_standings, winner, loser)
-            
-            # Check if team qualified
-            playoff_teams = self._get_playoff_teams(sim_standings)
-            if team_id in playoff_teams:
-                qualification_count += 1
+        # Other matches do not depend on the team's win count, so simulate them once per iteration
+        other_home = self._home_idx[other_matches]
+        other_away = self._away_idx[other_matches]
+        p_home = self.elo_calculator.calculate_win_probabilities(
+            [self._sim_schedule[j] for j in other_matches]
+        )
+        home_wins = np.random.random((iterations, len(other_matches))) < p_home[None, :]
+        winners = np.where(home_wins, other_home, other_away)
+        losers = np.where(home_wins, other_away, other_home)
+        
+        # Note: NRR updates are simplified
+        other_deltas = np.random.uniform(0.05, 0.15, (iterations, len(other_matches)))
+        rows = np.arange(iterations)[:, None]
+        points = np.tile(self._base_points.astype(np.int64), (iterations, 1))
+        nrr = np.tile(self._base_nrr.astype(np.float64), (iterations, 1))
+        np.add.at(points, (rows, winners), 2)
+        np.add.at(nrr, (rows, winners), other_deltas)
+        np.add.at(nrr, (rows, losers), -other_deltas)
+        
+        # Which of its matches the team wins decides which opponents take the points of its
+        # losses, so every iteration assigns the wins to a random permutation of its matches
+        opponents = np.where(
+            self._home_idx[remaining_matches] == team_idx,
+            self._away_idx[remaining_matches],
+            self._home_idx[remaining_matches]
+        )
+        opponent_onehot = np.zeros((remaining_count, n_teams), dtype=np.int64)
+        opponent_onehot[np.arange(remaining_count), opponents] = 1
+        perm = np.argsort(np.random.random((iterations, remaining_count)), axis=1)
+        opponent_onehot = opponent_onehot[perm]
+        
+        # With w wins the team wins its first w (permuted) matches and each later opponent takes 2 points
+        opponent_wins = np.zeros((iterations, remaining_count + 1, n_teams), dtype=np.int64)
+        opponent_wins[:, :-1] = opponent_onehot[:, ::-1].cumsum(axis=1)[:, ::-1]
+        
+        win_counts = np.arange(remaining_count + 1)
+        team_points = np.zeros((remaining_count + 1, n_teams), dtype=np.int64)
+        team_points[:, team_idx] = 2 * win_counts
+        
+        # Final points: rows are iterations, then win counts, then teams
+        final_points = points[:, None, :] + 2 * opponent_wins + team_points[None, :, :]
+        
+        # NRR swings of the team's matches: won matches before w, lost matches from w on
+        team_deltas = np.random.uniform(0.05, 0.15, (iterations, remaining_count))
+        opponent_deltas = team_deltas[:, :, None] * opponent_onehot
+        opponent_won_before = np.zeros((iterations, remaining_count + 1, n_teams))
+        opponent_won_before[:, 1:] = opponent_deltas.cumsum(axis=1)
+        team_won_before = np.zeros((iterations, remaining_count + 1))
+        team_won_before[:, 1:] = team_deltas.cumsum(axis=1)
+        
+        final_nrr = nrr[:, None, :] + opponent_deltas.sum(axis=1)[:, None, :] - 2 * opponent_won_before
+        final_nrr[:, :, team_idx] += 2 * team_won_before - team_deltas.sum(axis=1)[:, None]
+        
+        # Check if team qualified: only membership of the top 4 matters, so a partial selection is enough
+        key = _standings_key(final_points, final_nrr)
+        # With fewer than 4 teams every team qualifies, so partition at the last team instead
+        top_four = np.argpartition(-key, min(3, n_teams - 1), axis=-1)[..., :4]
+        qualified = (top_four == team_idx).any(axis=-1)
         
-        return qualification_count / iterations
\ No newline at end of file
+        return qualified.mean(axis=0).tolist()